@@ -1,7 +1,7 @@
 """
 Module: error_handlers
 """
-from flask import jsonify
+import orjson
 from service.models import DataValidationError
 from service import app
 from . import status
@@ -21,12 +21,7 @@ def bad_request(error):
     """Handles bad requests with 400_BAD_REQUEST"""
     message = str(error)
     app.logger.warning(message)
-    return (
-        jsonify(
-            status=status.HTTP_400_BAD_REQUEST, error="Bad Request", message=message
-        ),
-        status.HTTP_400_BAD_REQUEST,
-    )
+    return _error_response(status.HTTP_400_BAD_REQUEST, "Bad Request", message)
 
 
 @app.errorhandler(status.HTTP_404_NOT_FOUND)
@@ -34,10 +29,7 @@ def not_found(error):
     """Handles resources not found with 404_NOT_FOUND"""
     message = str(error)
     app.logger.warning(message)
-    return (
-        jsonify(status=status.HTTP_404_NOT_FOUND, error="Not Found", message=message),
-        status.HTTP_404_NOT_FOUND,
-    )
+    return _error_response(status.HTTP_404_NOT_FOUND, "Not Found", message)
 
 
 @app.errorhandler(status.HTTP_405_METHOD_NOT_ALLOWED)
@@ -45,13 +37,8 @@ def method_not_supported(error):
     """Handles unsupported HTTP methods with 405_METHOD_NOT_SUPPORTED"""
     message = str(error)
     app.logger.warning(message)
-    return (
-        jsonify(
-            status=status.HTTP_405_METHOD_NOT_ALLOWED,
-            error="Method not Allowed",
-            message=message,
-        ),
-        status.HTTP_405_METHOD_NOT_ALLOWED,
+    return _error_response(
+        status.HTTP_405_METHOD_NOT_ALLOWED, "Method not Allowed", message
     )
 
 
@@ -60,13 +47,8 @@ def mediatype_not_supported(error):
     """Handles unsupported media requests with 415_UNSUPPORTED_MEDIA_TYPE"""
     message = str(error)
     app.logger.warning(message)
-    return (
-        jsonify(
-            status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-            error="Unsupported media type",
-            message=message,
-        ),
-        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+    return _error_response(
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, "Unsupported media type", message
     )
 
 
@@ -75,11 +57,15 @@ def internal_server_error(error):
     """Handles unexpected server error with 500_SERVER_ERROR"""
     message = str(error)
     app.logger.error(message)
-    return (
-        jsonify(
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            error="Internal Server Error",
-            message=message,
-        ),
-        status.HTTP_500_INTERNAL_SERVER_ERROR,
+    return _error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal Server Error", message
+    )
+
+
+def _error_response(status_code, error, message):
+    """Builds a JSON error response encoded with orjson"""
+    return app.response_class(
+        orjson.dumps({"status": status_code, "error": error, "message": message}),
+        status=status_code,
+        mimetype="application/json",
     )
@@ -18,6 +18,13 @@ if not DATABASE_URI:
 # Configure SQLAlchemy
 SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
+SQLALCHEMY_ENGINE_OPTIONS = {"pool_pre_ping": True}
+
+# Size the pool to the gunicorn worker's threads (only QueuePool accepts these)
+WORKER_THREADS = int(os.getenv("WORKER_THREADS", "4"))
+if DATABASE_URI.startswith("postgresql"):
+    SQLALCHEMY_ENGINE_OPTIONS["pool_size"] = WORKER_THREADS
+    SQLALCHEMY_ENGINE_OPTIONS["pool_recycle"] = 1800
 
 # Secret for session management
 SECRET_KEY = os.getenv("SECRET_KEY", "s3cr3t-key-shhhh")
@@ -4,11 +4,26 @@ Account Service
 This microservice handles the lifecycle of Accounts
 """
 # pylint: disable=unused-import
-from flask import jsonify, request, make_response, abort, url_for   # noqa; F401
-from service.models import Account
+import hashlib
+import logging
+import orjson
+from flask import request, abort   # noqa; F401
+from service.models import db, Account
 from service.common import status  # HTTP Status Codes
 from . import app  # Import Flask application
 
+# Page sizes for listing Accounts
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+# Account columns returned by the list endpoint, resolved once at import
+_ACCOUNT_FIELDS = ("id", "name", "email", "address", "phone_number", "date_joined")
+_ACCOUNT_COLUMNS = tuple(getattr(Account, field) for field in _ACCOUNT_FIELDS)
+
+# Static response bodies are encoded once at import time
+_HEALTH_BODY = orjson.dumps({"status": "OK"})
+_INDEX_BODY = orjson.dumps({"name": "Account REST API Service", "version": "1.0"})
+
 
 ############################################################
 # Health Endpoint
@@ -16,7 +31,9 @@ from . import app  # Import Flask application
 @app.route("/health")
 def health():
     """Health Status"""
-    return jsonify(dict(status="OK")), status.HTTP_200_OK
+    return app.response_class(
+        _HEALTH_BODY, status=status.HTTP_200_OK, mimetype="application/json"
+    )
 
 
 ######################################################################
@@ -25,36 +42,31 @@ def health():
 @app.route("/")
 def index():
     """Root URL response"""
-    return (
-        jsonify(
-            name="Account REST API Service",
-            version="1.0",
-            # paths=url_for("list_accounts", _external=True),
-        ),
-        status.HTTP_200_OK,
+    return app.response_class(
+        _INDEX_BODY, status=status.HTTP_200_OK, mimetype="application/json"
     )
 
 
 ######################################################################
 # CREATE A NEW ACCOUNT
 ######################################################################
-@app.route("/accounts", methods=["POST"])
+@app.route("/accounts", methods=["POST"], strict_slashes=False)
 def create_accounts():
     """
     Creates an Account
     This endpoint will create an Account based the data in the body that is posted
     """
-    app.logger.info("Request to create an Account")
+    if app.logger.isEnabledFor(logging.INFO):
+        app.logger.info("Request to create an Account")
     check_content_type("application/json")
     account = Account()
     account.deserialize(request.get_json())
     account.create()
     message = account.serialize()
-    # Uncomment once get_accounts has been implemented
-    location_url = url_for("get_accounts", account_id=account.id, _external=True)
-    # location_url = "/"  # Remove once get_accounts has been implemented
-    return make_response(
-        jsonify(message), status.HTTP_201_CREATED, {"Location": location_url}
+    # The Account URL shape is fixed, so skip the URL map lookup of url_for
+    location_url = f"{request.url_root}accounts/{account.id}"
+    return _json_response(
+        message, status.HTTP_201_CREATED, {"Location": location_url}
     )
 
 ######################################################################
@@ -62,43 +74,56 @@ def create_accounts():
 ######################################################################
 
 
-@app.route("/accounts", methods=["GET"])
+@app.route("/accounts", methods=["GET"], strict_slashes=False)
 def get_accounts():
     """
     list Accounts
-    This endpoint will list all accounts and return them
+    This endpoint will list accounts a page at a time, ordered by id.
+    Pass the returned "next" value as the cursor to fetch the next page
     """
-    app.logger.info("Request to list all Accounts")
-    accounts = Account.all()
-    message = []
-    for account in accounts:
-        message.append(account.serialize())
-    return make_response(
-        jsonify(message), status.HTTP_200_OK
-    )
+    if app.logger.isEnabledFor(logging.INFO):
+        app.logger.info("Request to list all Accounts")
+    limit = request.args.get("limit", DEFAULT_PAGE_SIZE, type=int)
+    limit = min(max(limit, 1), MAX_PAGE_SIZE)
+    cursor = request.args.get("cursor", 0, type=int)
+    # Project the columns directly instead of hydrating Account objects
+    rows = db.session.execute(
+        db.select(*_ACCOUNT_COLUMNS)
+        .where(Account.id > cursor)
+        .order_by(Account.id)
+        .limit(limit)
+    ).all()
+    items = [dict(zip(_ACCOUNT_FIELDS, row)) for row in rows]
+    # A full page means there may be more Accounts after the last id
+    next_cursor = rows[-1].id if len(rows) == limit else None
+    message = {"items": items, "next": next_cursor}
+    return _json_response(message, status.HTTP_200_OK)
 
 ######################################################################
 # READ AN ACCOUNT
 ######################################################################
 
 
-@app.route("/accounts/<id>", methods=["GET"])
-def read_account(id):
+def read_account(account_id):
     """
     read an Account
     This endpoint will return account by ID
     """
-    app.logger.info("Request to read an Account")
-    account = Account.find(id)
+    if app.logger.isEnabledFor(logging.INFO):
+        app.logger.info("Request to read an Account")
+    account = db.session.get(Account, account_id)
     if account is None:
-        message = []
-        return make_response(
-            jsonify(message), status.HTTP_404_NOT_FOUND
-        )
-    message = account.serialize()
-    return make_response(
-        jsonify(message), status.HTTP_200_OK
-    )
+        return _not_found()
+    # Check If-None-Match before encoding so a 304 skips serialization
+    etag = _account_etag(account)
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        message = account.serialize()
+        response = _json_response(message, status.HTTP_200_OK)
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
 
 
 ######################################################################
@@ -106,45 +131,61 @@ def read_account(id):
 ######################################################################
 
 
-@app.route("/accounts/<id>", methods=["PUT"])
-def update_account(id):
+def update_account(account_id):
     """
     update an Account
     This endpoint will return account updated as requested if found or 404 not found
     """
-    app.logger.info("Request to update an Account")
-    found_account = Account.find(id)
+    if app.logger.isEnabledFor(logging.INFO):
+        app.logger.info("Request to update an Account")
+    found_account = db.session.get(Account, account_id)
     if found_account is None:
-        message = []
-        return make_response(
-            jsonify(message), status.HTTP_404_NOT_FOUND
-        )
+        return _not_found()
     found_account.deserialize(request.get_json())
-    found_account.update()
+    db.session.commit()
     message = found_account.serialize()
-    return make_response(
-        jsonify(message), status.HTTP_200_OK
-    )
+    return _json_response(message, status.HTTP_200_OK)
 
 ######################################################################
 # DELETE AN ACCOUNT
 ######################################################################
 
 
-@app.route("/accounts/<id>", methods=["DELETE"])
-def delete_account(id):
+def delete_account(account_id):
     """
     delete an Account
-    This endpoint will return after deleting an account if it exist
+    This endpoint will delete an account if it exists and return 204 either way
     """
-    app.logger.info("Request to delete an Account")
-    found_account = Account.find(id)
+    if app.logger.isEnabledFor(logging.INFO):
+        app.logger.info("Request to delete an Account")
+    found_account = db.session.get(Account, account_id)
     if found_account is not None:
         found_account.delete()
-        message = []
-        return make_response(
-            jsonify(message), status.HTTP_204_NO_CONTENT
-        )
+    return app.response_class(status=status.HTTP_204_NO_CONTENT)
+
+######################################################################
+# ROUTE REQUESTS FOR A SINGLE ACCOUNT
+######################################################################
+
+
+# Flask answers HEAD with the GET handler, so HEAD must dispatch to it too
+_ACCOUNT_HANDLERS = {
+    "GET": read_account,
+    "HEAD": read_account,
+    "PUT": update_account,
+    "DELETE": delete_account,
+}
+
+
+@app.route(
+    "/accounts/<int:account_id>", methods=["GET", "PUT", "DELETE"], strict_slashes=False
+)
+def account_resource(account_id):
+    """
+    route an Account request
+    This endpoint will dispatch to the read, update or delete handler by method
+    """
+    return _ACCOUNT_HANDLERS[request.method](account_id)
 
 ######################################################################
 #  U T I L I T Y   F U N C T I O N S
@@ -153,11 +194,43 @@ def delete_account(id):
 
 def check_content_type(media_type):
     """Checks that the media type is correct"""
-    content_type = request.headers.get("Content-Type")
-    if content_type and content_type == media_type:
+    # Werkzeug parses and caches the mimetype without any parameters
+    if request.mimetype == media_type:
         return
-    app.logger.error("Invalid Content-Type: %s", content_type)
+    if app.logger.isEnabledFor(logging.ERROR):
+        app.logger.error("Invalid Content-Type: %s", request.content_type)
     abort(
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
         f"Content-Type must be {media_type}",
     )
+
+
+def _json_response(payload, status_code, headers=None):
+    """Builds a JSON response encoded with orjson"""
+    return app.response_class(
+        orjson.dumps(payload),
+        status=status_code,
+        headers=headers,
+        mimetype="application/json",
+    )
+
+
+def _account_etag(account):
+    """Computes a stable ETag from the fields of an Account"""
+    fields = (
+        account.id,
+        account.name,
+        account.email,
+        account.address,
+        account.phone_number,
+        account.date_joined.isoformat(),
+    )
+    return hashlib.sha1(repr(fields).encode("utf-8")).hexdigest()
+
+
+def _not_found():
+    """Builds an empty 404 response for a missing Account"""
+    # Built per request: after_request hooks add headers to the response object
+    return app.response_class(
+        b"", status=status.HTTP_404_NOT_FOUND, mimetype="application/json"
+    )
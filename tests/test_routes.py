@@ -38,21 +38,32 @@ class TestAccountService(TestCase):
         app.logger.setLevel(logging.CRITICAL)
         init_db(app)
         talisman.force_https = False
+        db.session.query(Account).delete()  # start from an empty table
+        db.session.commit()
+
+        cls.client = app.test_client()
+        # Bind the session to one connection so each test can be rolled back
+        cls.session = db.session
+        cls.connection = db.engine.connect()
+        db.session = db.create_scoped_session(
+            options={"bind": cls.connection, "binds": {}}
+        )
 
     @classmethod
     def tearDownClass(cls):
         """Runs once before test suite"""
+        db.session.remove()
+        cls.connection.close()
+        db.session = cls.session
 
     def setUp(self):
         """Runs before each test"""
-        db.session.query(Account).delete()  # clean up the last tests
-        db.session.commit()
-
-        self.client = app.test_client()
+        self.transaction = self.connection.begin()
 
     def tearDown(self):
         """Runs once after each test case"""
         db.session.remove()
+        self.transaction.rollback()  # discard everything the test wrote
 
     ######################################################################
     #  H E L P E R   M E T H O D S
@@ -60,18 +71,9 @@ class TestAccountService(TestCase):
 
     def _create_accounts(self, count):
         """Factory method to create accounts in bulk"""
-        accounts = []
-        for _ in range(count):
-            account = AccountFactory()
-            response = self.client.post(BASE_URL, json=account.serialize())
-            self.assertEqual(
-                response.status_code,
-                status.HTTP_201_CREATED,
-                "Could not create test Account",
-            )
-            new_account = response.get_json()
-            account.id = new_account["id"]
-            accounts.append(account)
+        accounts = [AccountFactory(id=None) for _ in range(count)]
+        db.session.bulk_save_objects(accounts, return_defaults=True)
+        db.session.commit()
         return accounts
 
     ######################################################################
@@ -106,6 +108,7 @@ class TestAccountService(TestCase):
 
         # Check the data is correct
         new_account = response.get_json()
+        self.assertTrue(location.endswith(f"{BASE_URL}/{new_account['id']}"))
         self.assertEqual(new_account["name"], account.name)
         self.assertEqual(new_account["email"], account.email)
         self.assertEqual(new_account["address"], account.address)
@@ -127,22 +130,26 @@ class TestAccountService(TestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
 
+    def test_create_account_with_charset(self):
+        """It should Create an Account when the Content-Type has parameters"""
+        account = AccountFactory()
+        response = self.client.post(
+            BASE_URL,
+            json=account.serialize(),
+            content_type="application/json; charset=utf-8"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
     # ADD YOUR TEST CASES HERE ...
     def test_list_accounts(self):
         """It should list all Accounts"""
-        account = {}
-        response = {}
-        for i in range(10):
-            account[i] = AccountFactory()
-            response[i] = self.client.post(
-                BASE_URL,
-                json=account[i].serialize(),
-                content_type="application/json"
-            )
-            self.assertEqual(response[i].status_code, status.HTTP_201_CREATED)
+        account = self._create_accounts(10)
         new_response = self.client.get(BASE_URL)
         self.assertEqual(new_response.status_code, status.HTTP_200_OK)
-        new_accounts = new_response.get_json()
+        data = new_response.get_json()
+        new_accounts = data["items"]
+        self.assertEqual(len(new_accounts), 10)
+        self.assertIsNone(data["next"])
 
         # Check the data is correct
         for i in range(10):
@@ -152,58 +159,75 @@ class TestAccountService(TestCase):
             self.assertEqual(new_accounts[i]["phone_number"], account[i].phone_number)
             self.assertEqual(new_accounts[i]["date_joined"], str(account[i].date_joined))
 
+    def test_list_accounts_paginated(self):
+        """It should list Accounts a page at a time"""
+        accounts = self._create_accounts(5)
+        response = self.client.get(BASE_URL, query_string={"limit": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.get_json()
+        self.assertEqual([a["id"] for a in data["items"]], [a.id for a in accounts[:3]])
+        self.assertEqual(data["next"], accounts[2].id)
+
+        response = self.client.get(
+            BASE_URL, query_string={"limit": 3, "cursor": data["next"]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.get_json()
+        self.assertEqual([a["id"] for a in data["items"]], [a.id for a in accounts[3:]])
+        self.assertIsNone(data["next"])
+
     def test_read_account(self):
         """It should read an Account"""
-        account = AccountFactory()
-        response = self.client.post(
-            BASE_URL,
-            json=account.serialize(),
-            content_type="application/json"
-        )
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        created_account = response.get_json()
-        created_id = created_account["id"]
-        READ_URL = "/accounts/{}".format(created_id)
+        account = self._create_accounts(1)[0]
+        READ_URL = "/accounts/{}".format(account.id)
         found_response = self.client.get(READ_URL)
         self.assertEqual(found_response.status_code, status.HTTP_200_OK)
         found_account = found_response.get_json()
 
         # Check the data is correct
-        self.assertEqual(found_account["id"], created_account["id"])
+        self.assertEqual(found_account["id"], account.id)
         self.assertEqual(found_account["name"], account.name)
         self.assertEqual(found_account["email"], account.email)
         self.assertEqual(found_account["address"], account.address)
         self.assertEqual(found_account["phone_number"], account.phone_number)
         self.assertEqual(found_account["date_joined"], str(account.date_joined))
 
+    def test_read_account_not_modified(self):
+        """It should return 304_NOT_MODIFIED for a matching ETag"""
+        account = self._create_accounts(1)[0]
+        READ_URL = BASE_URL + f"/{account.id}"
+        response = self.client.get(READ_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response.headers.get("ETag")
+        self.assertIsNotNone(etag)
+        self.assertEqual(response.headers.get("Cache-Control"), "no-cache")
+
+        cached_response = self.client.get(READ_URL, headers={"If-None-Match": etag})
+        self.assertEqual(cached_response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(cached_response.data, b"")
+
+        stale_response = self.client.get(READ_URL, headers={"If-None-Match": '"stale"'})
+        self.assertEqual(stale_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(stale_response.get_json()["id"], account.id)
+
     def test_read_notvalid_account(self):
         """It should read a non-existing Account"""
-        account = AccountFactory()
-        response = self.client.post(
-            BASE_URL,
-            json=account.serialize(),
-            content_type="application/json"
-        )
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        created_account = response.get_json()
-        created_id = created_account["id"]
-        non_valid_id = created_id + 100
+        account = self._create_accounts(1)[0]
+        non_valid_id = account.id + 100
         READ_URL = BASE_URL + f"/{non_valid_id}"
         not_found_response = self.client.get(READ_URL)
         self.assertEqual(not_found_response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(not_found_response.data, b"")
+
+    def test_read_account_bad_id(self):
+        """It should not read an Account with a non-numeric id"""
+        response = self.client.get(BASE_URL + "/abc")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_update_account(self):
         """It should update an Account"""
-        account = AccountFactory()
-        response = self.client.post(
-            BASE_URL,
-            json=account.serialize(),
-            content_type="application/json"
-        )
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        created_account = response.get_json()
-        created_id = created_account["id"]
-        UPDATE_URL = BASE_URL + "/{}".format(created_id)
+        account = self._create_accounts(1)[0]
+        UPDATE_URL = BASE_URL + "/{}".format(account.id)
         update_account = AccountFactory()
         update_resp = self.client.put(
             UPDATE_URL,
@@ -222,15 +246,8 @@ class TestAccountService(TestCase):
 
     def test_update_notfound_account(self):
         """It should update an non-existing Account"""
-        account = AccountFactory()
-        response = self.client.post(
-            BASE_URL,
-            json=account.serialize(),
-            content_type="application/json"
-        )
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        created_account = response.get_json()
-        not_created_id = created_account["id"] + 100
+        account = self._create_accounts(1)[0]
+        not_created_id = account.id + 100
         UPDATE_URL = BASE_URL + "/{}".format(not_created_id)
         update_account = AccountFactory()
         update_resp = self.client.put(
@@ -242,16 +259,8 @@ class TestAccountService(TestCase):
 
     def test_delete_account(self):
         """It should delete an Account"""
-        account = AccountFactory()
-        response = self.client.post(
-            BASE_URL,
-            json=account.serialize(),
-            content_type="application/json"
-        )
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        created_account = response.get_json()
-        created_id = created_account["id"]
-        DELETE_URL = BASE_URL + "/{}".format(created_id)
+        account = self._create_accounts(1)[0]
+        DELETE_URL = BASE_URL + "/{}".format(account.id)
         delete_resp = self.client.delete(
             DELETE_URL
         )
@@ -264,6 +273,12 @@ class TestAccountService(TestCase):
         )
         self.assertEqual(read_resp.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_delete_notfound_account(self):
+        """It should return 204_NO_CONTENT when deleting a non-existing Account"""
+        response = self.client.delete(BASE_URL + "/0")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(response.data, b"")
+
     def test_security_headers(self):
         """It should return security headers"""
         response = self.client.get('/', environ_overrides=HTTPS_ENVIRON)